@@ -0,0 +1,55 @@
+"""
+Runs all scripts of this test suite in a pool of worker processes. Each worker loads and runs one test module at a
+time. Workers inherit the already imported musicscore package only with the ``fork`` start method; with ``spawn`` (the
+default on macOS and Windows) each worker imports it again. Each script writes its own xml file next to it, so the
+scripts are independent of each other.
+
+Usage: python -m musicscore.LilyPondUnofficialXMLTestSuite.run_suite [number of processes]
+"""
+import sys
+import unittest
+from multiprocessing import Pool, cpu_count
+from pathlib import Path
+
+from musicscore.part import Id
+
+__all__ = ['get_suite_module_names', 'run_suite']
+
+
+def get_suite_module_names():
+    """
+    :return: sorted dotted names of all test modules in this directory
+    """
+    return [f'musicscore.LilyPondUnofficialXMLTestSuite.{path.stem}' for path in
+            sorted(Path(__file__).parent.glob('test_*.py'))]
+
+
+def _run_module(module_name):
+    # A worker runs several modules. Some of them are plain scripts which create their score on import, so part ids of
+    # previously run modules are cleared like in IdTestCase.setUp().
+    Id.__refs__.clear()
+    suite = unittest.defaultTestLoader.loadTestsFromName(module_name)
+    result = unittest.TextTestRunner(stream=sys.stderr, verbosity=0).run(suite)
+    return module_name, result.testsRun, len(result.failures), len(result.errors)
+
+
+def run_suite(processes=None):
+    """
+    :param processes: number of worker processes. If ``None`` ``cpu_count()`` is used.
+    :return: ``True`` if all test modules passed
+    """
+    if processes is None:
+        processes = cpu_count()
+    with Pool(processes) as pool:
+        results = pool.map(_run_module, get_suite_module_names())
+    success = True
+    for module_name, tests_run, failures, errors in results:
+        if failures or errors:
+            success = False
+            print(f'{module_name}: {tests_run} tests, {failures} failures, {errors} errors')
+    print(f'{len(results)} modules, {sum(r[1] for r in results)} tests, {"OK" if success else "FAILED"}')
+    return success
+
+
+if __name__ == '__main__':
+    sys.exit(0 if run_suite(int(sys.argv[1]) if len(sys.argv) > 1 else None) else 1)
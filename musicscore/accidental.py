@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import Optional, Union
 
 from musicxml.xmlelement.xmlelement import XMLAccidental
@@ -6,8 +7,11 @@ from musicscore.musictree import MusicTree
 from musicscore.xmlwrapper import XMLWrapper
 
 __all__ = ['STANDARD', 'FLAT', 'SHARP', 'ENHARMONIC', 'FORCESHARP', 'FORCEFLAT', 'SIGNS', 'Accidental']
+
+# The mode tables are read-only. Accidental.get_pitch_parameters() looks up tables which are built from them once at import.
+
 #:
-STANDARD = {
+STANDARD = MappingProxyType({
     0: ('C', 0, 0),
     0.5: ('C', 0.5, 0),
     1: ('C', 1, 0),
@@ -32,10 +36,10 @@ STANDARD = {
     10.5: ('B', -0.5, 0),
     11: ('B', 0, 0),
     11.5: ('C', -0.5, 1)
-}
+})
 
 #:
-FLAT = {
+FLAT = MappingProxyType({
     0: ('C', 0, 0),
     0.5: ('D', -1.5, 0),
     1: ('D', -1, 0),
@@ -60,10 +64,10 @@ FLAT = {
     10.5: ('B', -0.5, 0),
     11: ('B', 0, 0),
     11.5: ('C', -0.5, 1)
-}
+})
 
 #:
-SHARP = {
+SHARP = MappingProxyType({
     0: ('C', 0, 0),
     0.5: ('C', 0.5, 0),
     1: ('C', 1, 0),
@@ -88,10 +92,10 @@ SHARP = {
     10.5: ('A', 1.5, 0),
     11: ('B', 0, 0),
     11.5: ('B', 0.5, 0)
-}
+})
 
 #:
-ENHARMONIC = {
+ENHARMONIC = MappingProxyType({
     0: ('C', 0, 0),
     0.5: ('D', -1.5, 0),
     1: ('D', -1, 0),
@@ -116,10 +120,10 @@ ENHARMONIC = {
     10.5: ('A', 1.5, 0),
     11: ('B', 0, 0),
     11.5: ('B', 0.5, 0)
-}
+})
 
 #:
-FORCESHARP = {
+FORCESHARP = MappingProxyType({
     0: ('B', 1, -1),
     0.5: ('B', 1.5, -1),
     1: ('B', 2, -1),
@@ -144,10 +148,10 @@ FORCESHARP = {
     10.5: ('A', 1.5, 0),
     11: ('A', 2, 0),
     11.5: ('B', 0.5, 0)
-}
+})
 
 #:
-FORCEFLAT = {
+FORCEFLAT = MappingProxyType({
     0: ('D', -2, 0),
     0.5: ('D', -1.5, 0),
     1: ('D', -1, 0),
@@ -172,7 +176,7 @@ FORCEFLAT = {
     10.5: ('C', -1.5, 1),
     11: ('C', -1, 1),
     11.5: ('C', -0.5, 1)
-}
+})
 
 #:
 SIGNS = {-2: 'flat-flat',
@@ -187,6 +191,22 @@ SIGNS = {-2: 'flat-flat',
          }
 
 
+_MODE_TABLES = {'standard': STANDARD, 'enharmonic': ENHARMONIC, 'force-sharp': FORCESHARP, 'force-flat': FORCEFLAT,
+                'flat': FLAT, 'sharp': SHARP}
+
+
+def _get_pitch_parameters_table(table):
+    # (step, alter, octave) of all midi values between 0 and 127.5 in quarter tone steps
+    output = {}
+    for midi_value in [v / 2 for v in range(256)]:
+        step, alter, octave = table[midi_value % 12]
+        output[midi_value] = (step, alter, octave + int(midi_value // 12) - 1)
+    return output
+
+
+_PITCH_PARAMETERS = {mode: _get_pitch_parameters_table(table) for mode, table in _MODE_TABLES.items()}
+
+
 class Accidental(MusicTree, XMLWrapper):
     """
     Parent type: :obj:`~musicscore.midi.Midi`
@@ -322,27 +342,15 @@ class Accidental(MusicTree, XMLWrapper):
         if midi_value == 0:
             return None
 
-        if self.mode == 'standard':
-            output = STANDARD[midi_value % 12]
-
-        elif self.mode == 'enharmonic':
-            output = ENHARMONIC[midi_value % 12]
-
-        elif self.mode == 'force-sharp':
-            output = FORCESHARP[midi_value % 12]
-
-        elif self.mode == 'force-flat':
-            output = FORCEFLAT[midi_value % 12]
-
-        elif self.mode == 'flat':
-            output = FLAT[midi_value % 12]
-
-        elif self.mode == 'sharp':
-            output = SHARP[midi_value % 12]
-
-        else:
-            raise ValueError
-        return output[0], output[1], output[2] + (int(midi_value // 12)) - 1
+        try:
+            table = _PITCH_PARAMETERS[self.mode]
+        except KeyError:
+            raise ValueError(f'Accidental mode {self.mode} is not valid.') from None
+        try:
+            return table[midi_value]
+        except KeyError:
+            output = _MODE_TABLES[self.mode][midi_value % 12]
+            return output[0], output[1], output[2] + (int(midi_value // 12)) - 1
 
     def __copy__(self):
         return self.__class__(mode=self.mode, show=self.show)
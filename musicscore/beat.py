@@ -517,16 +517,23 @@ class Beat(MusicTree, QuarterDurationMixin, QuantizeMixin, FinalizeMixin):
 
         :obj:`~musicscore.measure.Measure.finalize()` loops over all its beats calls this method.
         """
-        for chord in self.get_children()[:]:
-            split = self._split_not_writable(chord, chord.offset)
+        new_children = []
+        children_are_split = False
+        offset = 0
+        for chord in self.get_children():
+            # _split_not_writable changes chord's quarter_duration if it is split
+            quarter_duration = chord.quarter_duration
+            split = self._split_not_writable(chord, offset)
             if split:
                 for ch in split:
                     ch._parent = self
-                if chord == self.get_children()[-1]:
-                    self._children = self.get_children()[:-1] + split
-                else:
-                    index = self.get_children().index(chord)
-                    self._children = self.get_children()[:index] + split + self.get_children()[index + 1:]
+                new_children.extend(split)
+                children_are_split = True
+            else:
+                new_children.append(chord)
+            offset += quarter_duration
+        if children_are_split:
+            self._children = new_children
 
     @property
     def is_filled(self) -> bool:
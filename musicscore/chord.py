@@ -1,5 +1,5 @@
-import copy
 import warnings
+from functools import lru_cache
 from fractions import Fraction
 from typing import Union, List, Optional, Any, Dict
 
@@ -25,6 +25,30 @@ __all__ = ['Chord', 'Rest', 'GraceChord']
 
 from musicxml.xmlelement.xmlelement import XMLElement
 
+# Class sets for constant time membership checks of added xml elements. The lists in musicscore.util stay the public API.
+_ARTICULATION_CLASSES = frozenset(XML_ARTICULATION_CLASSES)
+_TECHNICAL_CLASSES = frozenset(XML_TECHNICAL_CLASSES)
+_ORNAMENT_CLASSES = frozenset(XML_ORNAMENT_CLASSES + XML_ORNAMENT_AND_OTHER_NOTATIONS)
+_DYNAMIC_CLASSES = frozenset(XML_DYNAMIC_CLASSES)
+_OTHER_NOTATION_CLASSES = frozenset(XML_OTHER_NOTATIONS)
+_NOTATION_CLASSES = frozenset(
+    XML_OTHER_NOTATIONS + XML_ORNAMENT_AND_OTHER_NOTATIONS + XML_DIRECTION_TYPE_AND_OTHER_NOTATIONS)
+_DIRECTION_TYPE_CLASSES = frozenset(XML_DIRECTION_TYPE_CLASSES + XML_DIRECTION_TYPE_AND_OTHER_NOTATIONS)
+
+# Parent types determined by Chord.add_x() if no parent_type is passed. The class lists are disjoint. Classes which can belong
+# to more than one parent are kept apart with their permitted parent types.
+_X_PARENT_TYPES = {
+    **dict.fromkeys(XML_ARTICULATION_CLASSES, 'articulation'),
+    **dict.fromkeys(XML_TECHNICAL_CLASSES, 'technical'),
+    **dict.fromkeys(XML_ORNAMENT_CLASSES, 'ornament'),
+    **dict.fromkeys(XML_OTHER_NOTATIONS, 'notation'),
+    **dict.fromkeys(XML_DIRECTION_TYPE_CLASSES, 'direction_type')
+}
+_AMBIVALENT_X_PARENT_TYPES = {
+    **dict.fromkeys(XML_ORNAMENT_AND_OTHER_NOTATIONS, ['notation', 'ornament']),
+    **dict.fromkeys(XML_DIRECTION_TYPE_AND_OTHER_NOTATIONS + XML_DYNAMIC_CLASSES, ['notations', 'direction_type'])
+}
+
 _all_articulations = Union[
     'XMLAccent', 'XMLStrongAccent', 'XMLStaccato', 'XMLTenuto', 'XMLDetachedLegato', 'XMLStaccatissimo',
     'XMLSpiccato', 'XMLScoop', 'XMLPlop', 'XMLDoit', 'XMLFalloff', 'XMLBreathMark', 'XMLCaesura', 'XMLStress',
@@ -101,7 +125,7 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
         self._original_starting_ties = None
 
     def _add_articulation(self, articulation, placement=None):
-        if articulation.__class__ not in XML_ARTICULATION_CLASSES:
+        if articulation.__class__ not in _ARTICULATION_CLASSES:
             raise ChordAddXException(f'{articulation} is not an articulation object.')
         if placement:
             try:
@@ -116,11 +140,11 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
         return super().add_child(child)
 
     def _add_direction_type(self, direction_type, placement=None):
-        if direction_type.__class__ in XML_DYNAMIC_CLASSES:
+        if direction_type.__class__ in _DYNAMIC_CLASSES:
             d = XMLDynamics()
             d.add_child(direction_type)
             direction_type = d
-        if direction_type.__class__ not in XML_DIRECTION_TYPE_CLASSES + XML_DIRECTION_TYPE_AND_OTHER_NOTATIONS:
+        if direction_type.__class__ not in _DIRECTION_TYPE_CLASSES:
             raise ChordAddXException(f'{direction_type} is not a direction type object.')
         if placement:
             self.add_direction_type(direction_type, placement=placement)
@@ -128,7 +152,7 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
             self.add_direction_type(direction_type)
 
     def _add_notation(self, notation, placement=None):
-        if notation.__class__ in XML_DYNAMIC_CLASSES:
+        if notation.__class__ in _DYNAMIC_CLASSES:
             d = XMLDynamics(placement=placement)
             d.add_child(notation)
             notation = d
@@ -137,7 +161,7 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
                 notation.type = 'upright'
             elif placement == 'below':
                 notation.type = 'inverted'
-        elif notation.__class__ not in XML_OTHER_NOTATIONS + XML_ORNAMENT_AND_OTHER_NOTATIONS + XML_DIRECTION_TYPE_AND_OTHER_NOTATIONS:
+        elif notation.__class__ not in _NOTATION_CLASSES:
             raise ChordAddXException(f'{notation} is not a notation type object.')
         elif placement:
             raise ChordAddXPlacementException(
@@ -148,7 +172,7 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
             self._update_xml_other_notations()
 
     def _add_ornament(self, ornament, placement=None):
-        if ornament.__class__ not in XML_ORNAMENT_CLASSES + XML_ORNAMENT_AND_OTHER_NOTATIONS:
+        if ornament.__class__ not in _ORNAMENT_CLASSES:
             raise ChordAddXException(f'{ornament} is not an ornament type object.')
         if placement:
             try:
@@ -160,7 +184,7 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
             self._update_xml_ornaments()
 
     def _add_technical(self, technical, placement=None):
-        if technical.__class__ not in XML_TECHNICAL_CLASSES:
+        if technical.__class__ not in _TECHNICAL_CLASSES:
             raise ChordAddXException(f'{technical} is not a technical object.')
         if placement:
             try:
@@ -172,7 +196,7 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
             self._update_xml_technicals()
 
     def _set_original_starting_ties(self, original_chord):
-        self._original_starting_ties = [copy.copy(midi._ties) for midi in original_chord.midis]
+        self._original_starting_ties = [midi._ties.copy() for midi in original_chord.midis]
 
     def _set_midis(self, midis):
         if isinstance(midis, str):
@@ -213,10 +237,10 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
                 for note in to_be_removed:
                     note.up.remove(note)
                     note.parent_chord = None
-                    del note
+            notes = self.notes
             for index, m in enumerate(self.midis):
-                if index < len(self.notes):
-                    self.notes[index].midi = m
+                if index < len(notes):
+                    notes[index].midi = m
                 else:
                     new_note = Note(midi=m, quarter_duration=self.quarter_duration)
                     self._add_child(new_note)
@@ -239,10 +263,11 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
 
         n = self.notes[0]
 
-        note_articulations_not_in_chord = [art for art in _get_note_xml_articulations() if art not in
+        note_xml_articulations = _get_note_xml_articulations()
+        note_articulations_not_in_chord = [art for art in note_xml_articulations if art not in
                                            self._xml_articulations]
         chord_articulations_not_in_note = [art for art in self._xml_articulations if
-                                           art not in _get_note_xml_articulations()]
+                                           art not in note_xml_articulations]
 
         if chord_articulations_not_in_note:
             n.get_or_create_xml_notations()
@@ -288,9 +313,10 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
 
         n = self.notes[0]
 
-        note_dynamics_not_in_chord = [art for art in _get_note_xml_dynamics() if art not in
+        note_xml_dynamics = _get_note_xml_dynamics()
+        note_dynamics_not_in_chord = [art for art in note_xml_dynamics if art not in
                                       self._xml_dynamics]
-        chord_dynamics_not_in_note = [art for art in self._xml_dynamics if art not in _get_note_xml_dynamics()]
+        chord_dynamics_not_in_note = [art for art in self._xml_dynamics if art not in note_xml_dynamics]
 
         if chord_dynamics_not_in_note:
             n.get_or_create_xml_notations()
@@ -338,9 +364,10 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
 
         n = self.notes[0]
 
-        note_ornaments_not_in_chord = [o for o in _get_note_xml_ornaments() if o not in
+        note_xml_ornaments = _get_note_xml_ornaments()
+        note_ornaments_not_in_chord = [o for o in note_xml_ornaments if o not in
                                        self._xml_ornaments]
-        chord_ornaments_not_in_note = [o for o in self._xml_ornaments if o not in _get_note_xml_ornaments()]
+        chord_ornaments_not_in_note = [o for o in self._xml_ornaments if o not in note_xml_ornaments]
 
         if chord_ornaments_not_in_note:
             n.get_or_create_xml_notations()
@@ -358,16 +385,17 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
     def _update_xml_other_notations(self):
         def _get_note_xml_other_notations():
             try:
-                return [ch for ch in n.xml_notations.get_children(ordered=False) if ch.__class__ in XML_OTHER_NOTATIONS]
+                return [ch for ch in n.xml_notations.get_children(ordered=False) if ch.__class__ in _OTHER_NOTATION_CLASSES]
             except AttributeError:
                 return []
 
         n = self.notes[0]
 
-        note_other_notations_not_in_chord = [on for on in _get_note_xml_other_notations() if on not in
+        note_xml_other_notations = _get_note_xml_other_notations()
+        note_other_notations_not_in_chord = [on for on in note_xml_other_notations if on not in
                                              self._xml_other_notations]
         chord_other_notations_not_in_note = [on for on in self._xml_other_notations if
-                                             on not in _get_note_xml_other_notations()]
+                                             on not in note_xml_other_notations]
 
         if chord_other_notations_not_in_note:
             n.get_or_create_xml_notations()
@@ -388,9 +416,10 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
 
         n = self.notes[0]
 
-        note_technicals_not_in_chord = [tech for tech in get_note_xml_technical() if tech not in
+        note_xml_technicals = get_note_xml_technical()
+        note_technicals_not_in_chord = [tech for tech in note_xml_technicals if tech not in
                                         self._xml_technicals]
-        chord_technicals_not_in_note = [tech for tech in self._xml_technicals if tech not in get_note_xml_technical()]
+        chord_technicals_not_in_note = [tech for tech in self._xml_technicals if tech not in note_xml_technicals]
 
         if chord_technicals_not_in_note:
             n.get_or_create_xml_notations()
@@ -409,10 +438,11 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
 
         n = self.notes[0]
 
-        note_lyrics_not_in_chord = [lyric for lyric in n.xml_object.find_children('XMLLyric') if lyric not in
+        note_xml_lyrics = n.xml_object.find_children('XMLLyric')
+        note_lyrics_not_in_chord = [lyric for lyric in note_xml_lyrics if lyric not in
                                     self._xml_lyrics]
         chord_lyrics_not_in_note = [lyric for lyric in self._xml_lyrics if
-                                    lyric not in n.xml_object.find_children('XMLLyric')]
+                                    lyric not in note_xml_lyrics]
 
         if chord_lyrics_not_in_note:
 
@@ -428,7 +458,7 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
         """
         :return: ``True`` if the property :obj:`~musicscore.midi.Midi.is_tied_to_next` of all midi children of Chord are return ``True``, otherwise ``False``
         """
-        if set([m.is_tied_to_next for m in self.midis]) == {True}:
+        if self._midis and all(m.is_tied_to_next for m in self._midis):
             return True
         else:
             return False
@@ -438,7 +468,7 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
         """
         :return: ``True`` if the property :obj:`~musicscore.midi.Midi.is_tied_to_previous` of all midi children of Chord are return ``True``, otherwise ``False``
         """
-        if set([m.is_tied_to_previous for m in self.midis]) == {True}:
+        if self._midis and all(m.is_tied_to_previous for m in self._midis):
             return True
         else:
             return False
@@ -700,7 +730,7 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
 
         if self._finalized is True:
             raise AlreadyFinalizedError(self, 'add_direction_type')
-        if direction_type.__class__ not in XML_DIRECTION_TYPE_CLASSES + XML_DIRECTION_TYPE_AND_OTHER_NOTATIONS:
+        if direction_type.__class__ not in _DIRECTION_TYPE_CLASSES:
             raise TypeError(
                 f'Wrong type {direction_type}. Possible classes: {XML_DIRECTION_TYPE_CLASSES + XML_DIRECTION_TYPE_AND_OTHER_NOTATIONS}')
         self._xml_direction_types[placement].append(direction_type)
@@ -751,24 +781,31 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
         """
         if self.up:
             raise ChordException(f'Chord {self} is already added to a measure. No grace chords can be added anymore.')
-        if isinstance(midis_or_grace_chord, GraceChord):
-            if type:
-                raise ValueError(f'Use GraceNote.type to set the type.')
-            if position:
-                raise ValueError(f'Use GraceNote.position to set the position.')
-            gch = midis_or_grace_chord
-        else:
-            if not position:
-                position = 'before'
-            gch = GraceChord(midis_or_grace_chord, type=type, position=position)
-
-        if gch.position == 'before':
-            self._grace_chords['before'].append(gch)
-        elif gch.position == 'after':
-            self._grace_chords['after'].append(gch)
+        gch = _get_grace_chord(midis_or_grace_chord, type, position)
+        self._grace_chords[gch.position].append(gch)
         gch.parent_chord = self
         return gch
 
+    def add_grace_chords(self, midis_or_grace_chords: List[Union[
+        'Midi', List['Midi'], int, float, List[Union[int, float]], 'GraceChord']], type: Optional[str] = None, *,
+                         position: Optional[str] = None) -> List['GraceChord']:
+        """
+        Same as :obj:`add_grace_chord` for a list of midis or grace chords which share the same ``type`` and ``position`` arguments.
+        All grace chords are created first and added afterwards in one pass. If one of them cannot be created none is added.
+
+        :param midis_or_grace_chords: list of :obj:`~musicscore.midi.Midi`\s or :obj:`~musicscore.chord.GraceChord`\s. Each element is treated like ``midis_or_grace_chord`` in :obj:`add_grace_chord`
+        :param type: see :obj:`add_grace_chord`
+        :param position: see :obj:`add_grace_chord`
+        :return: list of added :obj:`~musicscore.chord.GraceChord`\s
+        """
+        if self.up:
+            raise ChordException(f'Chord {self} is already added to a measure. No grace chords can be added anymore.')
+        grace_chords = [_get_grace_chord(x, type, position) for x in midis_or_grace_chords]
+        for gch in grace_chords:
+            self._grace_chords[gch.position].append(gch)
+            gch.parent_chord = self
+        return grace_chords
+
     def add_lyric(self, text: Union[Any, XMLLyric], **kwargs) -> XMLLyric:
         """
         This method is used to add :obj:`~musicxml.xmlelement.xmlelement.XMLLyric` to chord's private ``_xml_lyrics`` list.
@@ -897,23 +934,11 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
 
         """
         if parent_type is None:
-            if x.__class__ in XML_ARTICULATION_CLASSES:
-                parent_type = 'articulation'
-            elif x.__class__ in XML_TECHNICAL_CLASSES:
-                parent_type = 'technical'
-            elif x.__class__ in XML_ORNAMENT_CLASSES:
-                parent_type = 'ornament'
-            elif x.__class__ in XML_OTHER_NOTATIONS:
-                parent_type = 'notation'
-            elif x.__class__ in XML_DIRECTION_TYPE_CLASSES:
-                parent_type = 'direction_type'
-            elif x.__class__ in XML_ORNAMENT_AND_OTHER_NOTATIONS:
-                permitted_parent_types = ['notation', 'ornament']
-                raise NotationException(f'{x} is ambivalent. Set parent type {permitted_parent_types}.')
-            elif x.__class__ in XML_DIRECTION_TYPE_AND_OTHER_NOTATIONS or x.__class__ in XML_DYNAMIC_CLASSES:
-                permitted_parent_types = ['notations', 'direction_type']
-                raise NotationException(f'{x} is ambivalent. Set parent type {permitted_parent_types}.')
-            else:
+            parent_type = _X_PARENT_TYPES.get(x.__class__)
+            if parent_type is None:
+                permitted_parent_types = _AMBIVALENT_X_PARENT_TYPES.get(x.__class__)
+                if permitted_parent_types is not None:
+                    raise NotationException(f'{x} is ambivalent. Set parent type {permitted_parent_types}.')
                 raise ValueError(f'parent_type of {x} could not be determined.')
 
         if parent_type == 'articulation':
@@ -1192,7 +1217,7 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
         self.midis = [0]
 
     def __setattr__(self, key, value):
-        if key[0] != '_' and key not in self._ATTRIBUTES.union(self._TREE_ATTRIBUTES) and key not in self.__dict__:
+        if key[0] != '_' and key not in _get_chord_attributes(self.__class__) and key not in self.__dict__:
             if self.notes:
                 if isinstance(value, str) or not hasattr(value, '__iter__'):
                     value = [value] * len(self.notes)
@@ -1209,9 +1234,10 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
             raise AttributeError(f"Chord cannot call Note method {item}. Call this method on each note separately")
         return output
 
-    def __deepcopy__(self, memodict={}):
+    def __deepcopy__(self, memodict=None):
         '''
-        Only midi and quarter_duration are deepcopied. _ties are copied.
+        Only midi and quarter_duration are deepcopied. _ties are copied. A chord which appears more than once in a deepcopied
+        structure is copied only once.
         Not included in deepcopy at the moment:
         self._xml_direction_types
         self._xml_directions = []
@@ -1226,8 +1252,13 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
         '''
         if self._notes_are_set:
             raise DeepCopyException("After setting notes, Midi cannot be deepcopied anymore. ")
-        copied = self.__class__(midis=[midi.__deepcopy__() for midi in self.midis],
-                                quarter_duration=self.quarter_duration.__deepcopy__())
+        if memodict is None:
+            memodict = {}
+        elif id(self) in memodict:
+            return memodict[id(self)]
+        copied = self.__class__(midis=[midi.__deepcopy__(memodict) for midi in self.midis],
+                                quarter_duration=self.quarter_duration.__deepcopy__(memodict))
+        memodict[id(self)] = copied
         return copied
 
 
@@ -1289,6 +1320,12 @@ class GraceChord(Chord):
         """
         raise GraceChordCannotHaveGraceNotesError
 
+    def add_grace_chords(self, midis_or_grace_chords, type=None, *, position=None):
+        """
+        :exception: :obj:`~musicscore.exceptions.GraceChordCannotHaveGraceNotesError`
+        """
+        raise GraceChordCannotHaveGraceNotesError
+
     def get_grace_chords(self, position='before'):
         """
         :exception: :obj:`~musicscore.exceptions.GraceChordCannotHaveGraceNotesError`
@@ -1387,6 +1424,24 @@ class Rest(Chord):
             self.notes[0].xml_rest.measure = self.measure
 
 
+@lru_cache(maxsize=None)
+def _get_chord_attributes(cls: type) -> frozenset:
+    # Chord.__setattr__ checks every public attribute against these class level sets.
+    return frozenset(cls._ATTRIBUTES.union(cls._TREE_ATTRIBUTES))
+
+
+def _get_grace_chord(midis_or_grace_chord, type, position) -> GraceChord:
+    if isinstance(midis_or_grace_chord, GraceChord):
+        if type:
+            raise ValueError(f'Use GraceNote.type to set the type.')
+        if position:
+            raise ValueError(f'Use GraceNote.position to set the position.')
+        return midis_or_grace_chord
+    if not position:
+        position = 'before'
+    return GraceChord(midis_or_grace_chord, type=type, position=position)
+
+
 def _split_copy(chord: Chord, new_quarter_duration: Union[QuarterDuration, Fraction, int, float] = None) -> Chord:
     """
     This function is used when a chord needs to be split. It creates a copy of the chord with a new quarter_duration object. All midis
@@ -1420,13 +1475,15 @@ def _group_chords(chords: List[Chord], quarter_durations: List[Union[QuarterDura
         output.append([])
     index = 0
     current_quarter_duration = quarter_durations[0]
+    current_sum = 0
     for ch in chords:
         output[index].append(ch)
-        current_sum = sum(c.quarter_duration for c in output[index])
+        current_sum += ch.quarter_duration
         if current_sum < current_quarter_duration:
             pass
         elif current_sum == current_quarter_duration:
             index += 1
+            current_sum = 0
             if index == len(quarter_durations):
                 pass
             else:
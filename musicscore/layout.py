@@ -97,10 +97,10 @@ class Margins:
         if side not in ['left', 'right', 'top', 'bottom']:
             raise ValueError
         if side in ['top', 'bottom'] and isinstance(self.parent, SystemLayout):
-            if eval(f"self.{side}") is not None:
+            if getattr(self, side) is not None:
                 raise ValueError
         else:
-            setattr(self._parent_xml_object, f"xml_{side}_margin", eval(f"self.{side}"))
+            setattr(self._parent_xml_object, f"xml_{side}_margin", getattr(self, side))
 
     @property
     def bottom(self):
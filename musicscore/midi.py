@@ -1,4 +1,3 @@
-import copy
 from math import log2
 from typing import Optional, Union, List
 
@@ -9,6 +8,7 @@ from musicxml.xsd.xsdsimpletype import XSDSimpleTypeNoteheadValue  # type: ignor
 
 from musicscore.accidental import Accidental
 from musicscore.musictree import MusicTree
+from musicscore.util import isinstance_as_string
 
 __all__ = ['Midi', 'MidiNote', 'C', 'D', 'E', 'F', 'G', 'A', 'B', 'midi_to_frequency', 'frequency_to_midi',
            'get_accidental_mode']
@@ -98,7 +98,7 @@ class Midi(MusicTree):
         self.accidental = accidental
 
     def _set_parent_chord(self, value):
-        if value is not None and 'Chord' not in [cls.__name__ for cls in value.__class__.__mro__]:
+        if value is not None and not isinstance_as_string(value, 'Chord'):
             raise TypeError
         self._parent_chord = value
         # self._parent = value
@@ -111,13 +111,13 @@ class Midi(MusicTree):
     def _update_pitch_parameters(self):
         pitch = self.get_pitch_or_rest()
         if isinstance(pitch, XMLPitch):
-            if not self.accidental.get_pitch_parameters()[1]:
+            step, alter, octave = self.accidental.get_pitch_parameters()
+            if not alter:
                 if pitch.xml_alter:
                     pitch.remove(pitch.xml_alter)
-                pitch.xml_step, pitch.xml_octave = self.accidental.get_pitch_parameters()[0], \
-                    self.accidental.get_pitch_parameters()[2]
+                pitch.xml_step, pitch.xml_octave = step, octave
             else:
-                pitch.xml_step, pitch.xml_alter, pitch.xml_octave = self.accidental.get_pitch_parameters()
+                pitch.xml_step, pitch.xml_alter, pitch.xml_octave = step, alter, octave
         else:
             raise TypeError
 
@@ -225,7 +225,7 @@ class Midi(MusicTree):
 
     @parent_note.setter
     def parent_note(self, value):
-        if value is not None and 'Note' not in [cls.__name__ for cls in value.__class__.__mro__]:
+        if value is not None and not isinstance_as_string(value, 'Note'):
             raise TypeError
         self._parent_note = value
         self._parent = value
@@ -255,7 +255,7 @@ class Midi(MusicTree):
         if self.value == 0:
             return 'rest'
 
-        pitch_step = self.accidental.get_pitch_parameters()[1]
+        step, pitch_step, _ = self.accidental.get_pitch_parameters()
 
         if not pitch_step:
             accidental = ''
@@ -274,7 +274,7 @@ class Midi(MusicTree):
         else:
             accidental = str(pitch_step)
 
-        return f"{self.accidental.get_pitch_parameters()[0]}{accidental}{self.octave}"
+        return f"{step}{accidental}{self.octave}"
 
     # //public methods
     def add_child(self, child: [Accidental]) -> Accidental:
@@ -361,14 +361,19 @@ class Midi(MusicTree):
         copied._ties = self._ties
         return copied
 
-    def __deepcopy__(self, memodict={}):
-        copied_accidental = copy.copy(self.accidental)
+    def __deepcopy__(self, memodict=None):
+        if memodict is None:
+            memodict = {}
+        elif id(self) in memodict:
+            return memodict[id(self)]
+        copied_accidental = self.accidental.__copy__()
         copied = self.__class__(value=self.value, accidental=copied_accidental)
-        copied._ties = copy.copy(self._ties)
+        copied._ties = self._ties.copy()
+        memodict[id(self)] = copied
         return copied
 
     def _copy_for_split(self):
-        copied_accidental = copy.copy(self.accidental)
+        copied_accidental = self.accidental.__copy__()
         copied = self.__class__(value=self.value, accidental=copied_accidental)
         copied.notehead = self.notehead
         return copied
@@ -426,14 +431,19 @@ class MidiNote(Midi):
         copied._ties = self._ties
         return copied
 
-    def __deepcopy__(self, memodict={}):
-        copied_accidental = copy.copy(self.accidental)
+    def __deepcopy__(self, memodict=None):
+        if memodict is None:
+            memodict = {}
+        elif id(self) in memodict:
+            return memodict[id(self)]
+        copied_accidental = self.accidental.__copy__()
         copied = Midi(value=self.value, accidental=copied_accidental)
-        copied._ties = copy.copy(self._ties)
+        copied._ties = self._ties.copy()
+        memodict[id(self)] = copied
         return copied
 
     def _copy_for_split(self):
-        copied_accidental = copy.copy(self.accidental)
+        copied_accidental = self.accidental.__copy__()
         copied = Midi(value=self.value, accidental=copied_accidental)
         copied.notehead = self.notehead
         return copied
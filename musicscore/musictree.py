@@ -6,6 +6,11 @@ from tree.tree import Tree
 
 __all__ = ['MusicTree']
 
+_LAYER_CLASS_NAMES = ['Score', 'Part', 'Measure', 'Staff', 'Voice', 'Beat', 'Chord']
+_LAYER_NUMBER_KEYS = ['part_number', 'measure_number', 'staff_number', 'voice_number', 'beat_number', 'chord_number']
+# part_number: get_part, measure_number: get_measure etc.
+_LAYER_GETTER_NAMES = {key: f"get_{key.split('_')[0]}" for key in _LAYER_NUMBER_KEYS}
+
 
 class MusicTree(Tree):
     """
@@ -40,12 +45,9 @@ class MusicTree(Tree):
                 raise TypeError(f'kwargs values {kwargs} must be positive integers')
 
         def _get_default_keys():
-            default_keys = ['part_number', 'measure_number', 'staff_number', 'voice_number', 'beat_number',
-                            'chord_number']
-            class_names = ['Score', 'Part', 'Measure', 'Staff', 'Voice', 'Beat', 'Chord']
-            class_index = class_names.index(class_name)
-            get_class_index = -1 if not get_class_name else class_names.index(get_class_name)
-            return default_keys[class_index:get_class_index]
+            class_index = _LAYER_CLASS_NAMES.index(class_name)
+            get_class_index = -1 if not get_class_name else _LAYER_CLASS_NAMES.index(get_class_name)
+            return _LAYER_NUMBER_KEYS[class_index:get_class_index]
 
         default_keys = _get_default_keys()
         if args and kwargs:
@@ -79,6 +81,14 @@ class MusicTree(Tree):
         except KeyError:
             raise NotImplementedError(f'{self.__class__.__name__} add_child() not implemented.')
 
+    def _get_descendents_of_type(self, class_name):
+        # All children of a layer are of the same type. The tree is walked layer by layer without recursion until the
+        # layer of class_name is reached.
+        nodes = self.get_children()
+        while nodes and not isinstance_as_string(nodes[0], class_name):
+            nodes = [child for node in nodes for child in node.get_children()]
+        return nodes
+
     def _get_kwargs(self, args_, kwargs_, get_class_name):
         if isinstance_as_string(self, 'Score'):
             return self._check_args_kwargs(args_, kwargs_, 'Score', get_class_name)
@@ -110,9 +120,8 @@ class MusicTree(Tree):
                 return None
         else:
             output = self
-            for key in kwargs:
-                string_to_eval = f"output.get_{key.split('_')[0]}(kwargs['{key}'])"
-                output = eval(string_to_eval)
+            for key, value in kwargs.items():
+                output = getattr(output, _LAYER_GETTER_NAMES[key])(value)
                 if not output:
                     return None
             return output
@@ -185,16 +194,13 @@ class MusicTree(Tree):
         :return: a flat list of all beats.
         :rtype: List[:obj:`~musicscore.beat.Beat`]
         """
-        if isinstance_as_string(self, 'Voice'):
-            return self.get_children()
-        else:
-            output = [ch for child in self.get_children() for ch in child.get_beats()]
-            if not output:
-                for cls_name in ['Beat', 'Chord', 'Note', 'Midi', 'Accidental']:
-                    if isinstance_as_string(self, cls_name):
-                        raise MusicTreeTypeError(
-                            f'MusicTree descendents of type {self.__class__} cannot use this method.')
-            return output
+        output = self._get_descendents_of_type('Beat')
+        if not output:
+            for cls_name in ['Beat', 'Chord', 'Note', 'Midi', 'Accidental']:
+                if isinstance_as_string(self, cls_name):
+                    raise MusicTreeTypeError(
+                        f'MusicTree descendents of type {self.__class__} cannot use this method.')
+        return output
 
     def get_chords(self) -> List['Chord']:
         """
@@ -206,16 +212,13 @@ class MusicTree(Tree):
         :return: a flat list of all chords.
         :rtype: List[:obj:`~musicscore.chord.Chord`]
         """
-        if isinstance_as_string(self, 'Beat'):
-            return self.get_children()
-        else:
-            output = [ch for child in self.get_children() for ch in child.get_chords()]
-            if not output:
-                for cls_name in ['Chord', 'Note', 'Midi', 'Accidental']:
-                    if isinstance_as_string(self, cls_name):
-                        raise MusicTreeTypeError(
-                            f'MusicTree descendents of type {self.__class__} cannot use this method.')
-            return output
+        output = self._get_descendents_of_type('Chord')
+        if not output:
+            for cls_name in ['Chord', 'Note', 'Midi', 'Accidental']:
+                if isinstance_as_string(self, cls_name):
+                    raise MusicTreeTypeError(
+                        f'MusicTree descendents of type {self.__class__} cannot use this method.')
+        return output
 
     def get_measure(self, *args, **kwargs) -> 'Measure':
         """
@@ -58,10 +58,13 @@ class Note(MusicTree, XMLWrapper, QuarterDurationMixin):
         super().__init__(quarter_duration=quarter_duration)
         self.midi = midi
         self._parent = self.parent_chord
-        self._update_xml_notehead()
+        # A new xml_object has neither a notehead nor dots. Nothing has to be removed if none are needed.
+        if self.midi.notehead is not None:
+            self._update_xml_notehead()
         self._update_xml_voice()
         self._update_xml_staff()
-        self._update_xml_dots()
+        if self.parent_chord.number_of_dots:
+            self._update_xml_dots()
         self._update_xml_time_modification()
         self._update_xml_tuplet()
         self._update_xml_beams()
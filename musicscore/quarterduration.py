@@ -15,6 +15,7 @@ class QuarterDuration(numbers.Rational):
     value property for more information.
     QuarterDuration has all needed magic methods for numeral comparison and conversion.
     """
+    __slots__ = ('_value', '_beat_subdivision', '_beat_quarter_duration', '_type_and_dots')
 
     def __init__(self, *value):
         self._value = None
@@ -185,7 +186,7 @@ class QuarterDuration(numbers.Rational):
             self._value = Fraction(val).limit_denominator(1000)
         elif hasattr(val, '__iter__'):
             if len(val) == 1:
-                self._value = Fraction(val[0]).limit_denominator(1000)
+                self._value = _to_fraction(val[0])
             elif len(val) == 2:
                 self._value = Fraction(*val).limit_denominator(1000)
             else:
@@ -319,12 +320,16 @@ class QuarterDuration(numbers.Rational):
         return self.value.__eq__(_convert_other(other))
 
     def __copy__(self):
-        return self.__class__(self.value)
+        return self.__class__(self.value.numerator, self.value.denominator)
 
     def __deepcopy__(self, memodict={}):
         return self.__class__(self.value)
 
 
+_WRITABLE_QUARTER_DURATIONS = frozenset(
+    {1 / 64, 1 / 32, 3 / 64, 1 / 16, 3 / 32, 1 / 8, 3 / 16, 1 / 4, 3 / 8, 1 / 2, 3 / 4, 1, 3 / 2, 2, 3, 4, 6, 8, 12})
+
+
 def _is_writable(quarter_duration: Union[float, int, Fraction, 'QuarterDuration']):
     """
     Function to check if a quarter duration is writable or must be split into two durations.
@@ -339,37 +344,28 @@ def _is_writable(quarter_duration: Union[float, int, Fraction, 'QuarterDuration'
     >>> _is_writable(3/8)
     True
     """
-    writables = {1 / 64,
-                 1 / 32,
-                 3 / 64,
-                 1 / 16,
-                 3 / 32,
-                 1 / 8,
-                 3 / 16,
-                 1 / 4,
-                 3 / 8,
-                 1 / 2,
-                 3 / 4,
-                 1,
-                 3 / 2,
-                 2,
-                 3,
-                 4,
-                 6,
-                 8,
-                 12}
-
-    if quarter_duration in writables:
+    if quarter_duration in _WRITABLE_QUARTER_DURATIONS:
         return True
     else:
         return False
 
 
+def _to_fraction(value):
+    # Results of arithmetic between quarter durations are already Fractions with small denominators. limit_denominator is only
+    # needed for floats and for fractions with a denominator beyond the limit.
+    if isinstance(value, Fraction):
+        if value.denominator <= 1000:
+            return value
+    elif isinstance(value, int):
+        return Fraction(value)
+    return Fraction(value).limit_denominator(1000)
+
+
 def _convert_other(other):
     if isinstance(other, QuarterDuration):
         return other.value
 
-    return Fraction(other).limit_denominator(1000)
+    return _to_fraction(other)
 
 
 class QuarterDurationMixin:
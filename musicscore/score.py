@@ -9,6 +9,7 @@ from musicscore.musictree import MusicTree
 from musicscore.quantize import QuantizeMixin
 from musicscore.quarterduration import QuarterDuration
 from musicscore.xmlwrapper import XMLWrapper
+from musicscore.xmlwriter import XML_HEADER, StreamingXMLWriter
 from musicxml.xmlelement.xmlelement import XMLScorePartwise, XMLPartList, XMLCredit, XMLCreditWords, XMLIdentification, \
     XMLEncoding, \
     XMLSupports, XMLScorePart, XMLPartGroup, XMLGroupSymbol, XMLGroupBarline, XMLGroupName, XMLGroupAbbreviation, \
@@ -325,18 +326,17 @@ class Score(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
 
     def export_xml(self, path: 'pathlib.Path') -> None:
         """
-        Creates a musicxml file
+        Creates a musicxml file. The score is finalized if needed and its xml tree is streamed measure by measure to the file
+        via :obj:`~musicscore.xmlwriter.StreamingXMLWriter`.
 
         :param path: Output xml file
         :return: None
         """
-        with open(path, '+w') as f:
-            f.write("""<?xml version="1.0" encoding="UTF-8" standalone="no"?>
-<!DOCTYPE score-partwise PUBLIC
-    "-//Recordare//DTD MusicXML 4.0 Partwise//EN"
-    "http://www.musicxml.org/dtds/partwise.dtd">
-""")
-            f.write(self.to_string())
+        if not self._finalized:
+            self.finalize()
+        with open(path, '+w', encoding='utf-8') as f:
+            f.write(XML_HEADER)
+            StreamingXMLWriter(f).write(self.xml_object)
 
     def finalize(self) -> None:
         self._create_missing_measures()
@@ -2,7 +2,7 @@ from unittest import TestCase
 
 from musicscore.exceptions import MusicTreeTypeError
 from musicscore.midi import Midi
-from musicscore.accidental import Accidental
+from musicscore.accidental import Accidental, STANDARD
 
 
 class TestAccidental(TestCase):
@@ -26,6 +26,11 @@ class TestAccidental(TestCase):
         assert a.get_pitch_parameters() == ('B', 2, 3)
         assert midi.accidental.get_pitch_parameters() == ('B', 2, 3)
 
+    def test_mode_tables_are_read_only(self):
+        with self.assertRaises(TypeError):
+            STANDARD[1] = ('D', -1, 0)
+        assert Accidental().get_pitch_parameters(midi_value=61) == ('C', 1, 4)
+
     def test_accidental_sign(self):
         a = Accidental()
         assert a.sign is None
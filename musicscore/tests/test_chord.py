@@ -391,6 +391,11 @@ class TestTreeChord(ChordTestCase):
         assert [id(midi) for midi in copied.midis] != [id(midi) for midi in chord.midis]
         assert chord.quarter_duration.value == copied.quarter_duration.value
         assert id(chord.quarter_duration) != id(copied.quarter_duration)
+        memo = {}
+        copied = chord.__deepcopy__(memo)
+        assert chord.__deepcopy__(memo) is copied
+        assert copied is not chord
+        assert all(midi.__deepcopy__(memo) is copied_midi for midi, copied_midi in zip(chord.midis, copied.midis))
         chord._parent = self.mock_beat
         chord.finalize()
         with self.assertRaises(DeepCopyException):
@@ -418,6 +423,12 @@ class TestTreeChord(ChordTestCase):
         with self.assertRaises(AlreadyFinalizedError):
             chord.add_midi(80)
 
+    def test_add_midi_after_changing_midi_value(self):
+        chord = Chord([60, 64], 2)
+        chord.midis[0].value = 70
+        chord.add_midi(62)
+        assert [midi.value for midi in chord.midis] == [62, 64, 70]
+
     def test_add_direction_type(self):
         score = Score()
         p = score.add_part('part-1')
@@ -790,6 +801,20 @@ class TestAddGraceChord(ChordTestCase):
         assert [[m.value for m in gc.midis] for gc in all_gcs] == [[60], [61], [62, 64], [63]]
         assert [gc.type for gc in all_gcs] == [None, 'quarter', None, '16th']
 
+    def test_add_grace_chords(self):
+        ch = Chord(60, 1)
+        gcs = ch.add_grace_chords([62, [63, 65], 67], type='16th', position='after')
+        assert ch.get_grace_chords(position='after') == gcs
+        assert ch.get_grace_chords(position='before') == []
+        assert [[m.value for m in gc.midis] for gc in gcs] == [[62], [63, 65], [67]]
+        assert {gc.type for gc in gcs} == {'16th'}
+        assert all(gc.parent_chord is ch for gc in gcs)
+        with self.assertRaises(ValueError):
+            ch.add_grace_chords([68, GraceChord(69)], type='16th')
+        assert len(ch.get_grace_chords(position='before')) == 0
+        with self.assertRaises(GraceChordCannotHaveGraceNotesError):
+            gcs[0].add_grace_chords([70])
+
     def test_add_grace_chord_finalize(self):
         part = Part('p1')
         ch = Chord(midis=[60, 63], quarter_duration=4)
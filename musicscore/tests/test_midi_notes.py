@@ -66,6 +66,9 @@ class TestMidiNotes(TestCase):
         assert m.accidental.show == copied.accidental.show
         assert id(m._ties) != id(copied._ties)
         assert m._ties == copied._ties
+        memo = {}
+        copied = m.__deepcopy__(memo)
+        assert m.__deepcopy__(memo) is copied
 
         copied = m._copy_for_split()
         assert m != copied
@@ -1,3 +1,5 @@
+import inspect
+import io
 from unittest import skip
 
 from musicscore.chord import Chord
@@ -6,8 +8,10 @@ from musicscore.layout import StaffLayout
 from musicscore.measure import Measure
 from musicscore.part import Part
 from musicscore.score import Score, TITLE, SUBTITLE
-from musicscore.tests.util import IdTestCase
-from musicxml import XMLNote
+from musicscore.tests.util import IdTestCase, generate_path
+from musicscore.xmlwriter import XML_HEADER, StreamingXMLWriter
+from musicxml import XMLNote, XMLLyric
+from musicxml.exceptions import XMLElementChildrenRequired
 
 
 class TestScore(IdTestCase):
@@ -345,3 +349,26 @@ class TestScore(IdTestCase):
         for p in parts:
             assert p.get_children()[-1].xml_barline.location == 'right'
             assert p.get_children()[-1].xml_barline.xml_bar_style.value_ == 'light-light'
+
+    def test_export_xml_equals_to_string(self):
+        score = Score(title='Streamed\nScore')
+        for i in range(1, 3):
+            p = score.add_part(f'p-{i}')
+            ch = Chord([60, 64], 3)
+            ch.add_lyric('first line\nsecond line')
+            p.add_chord(ch)
+            p.add_chord(Chord(0, 3))
+        path = generate_path(inspect.currentframe())
+        score.export_xml(path)
+        with open(path, encoding='utf-8') as f:
+            assert f.read() == XML_HEADER + score.to_string()
+
+    def test_streaming_xml_writer_final_checks(self):
+        score = Score()
+        p = score.add_part('p-1')
+        ch = Chord(60, 4)
+        ch.add_lyric(XMLLyric())
+        p.add_chord(ch)
+        score.finalize()
+        with self.assertRaises(XMLElementChildrenRequired):
+            StreamingXMLWriter(io.StringIO()).write(score.xml_object)
@@ -1,4 +1,5 @@
 import math
+from functools import lru_cache
 from typing import Union, List
 
 from musicscore.exceptions import WrongNumberOfChordsError, LyricSyllabicOrExtensionError
@@ -128,12 +129,21 @@ def isinstance_as_string(child: object, parent_class_names: Union[str, List[str]
     if isinstance(parent_class_names, str):
         parent_class_names = [parent_class_names]
 
+    mro_class_names = _get_mro_class_names(child.__class__)
     for parent_class_name in parent_class_names:
-        if parent_class_name not in [cls.__name__ for cls in child.__class__.__mro__]:
+        if parent_class_name not in mro_class_names:
             return False
     return True
 
 
+@lru_cache(maxsize=None)
+def _get_mro_class_names(cls: type) -> frozenset:
+    """
+    Class hierarchies do not change at runtime. The names of all classes in a class's __mro__ are collected only once per class.
+    """
+    return frozenset(c.__name__ for c in cls.__mro__)
+
+
 def _chord_is_in_a_repetition(chord):
     my_index = chord.up.up.get_chords().index(chord)
     if my_index > 0 and not chord.is_tied_to_previous:
@@ -37,13 +37,7 @@ class XMLWrapper:
             raise ValueError(f'{self.__class__.__name__} has no xml object.')
 
     def __setattr__(self, key, value):
-        attributes = self._ATTRIBUTES
-        try:
-            if self._TREE_ATTRIBUTES:
-                attributes.union(self._TREE_ATTRIBUTES)
-        except AttributeError:
-            pass
-        if key[0] != '_' and ('_xml_object' in self.__dict__ and key not in attributes and key not in self.__dict__):
+        if key[0] != '_' and ('_xml_object' in self.__dict__ and key not in self._ATTRIBUTES and key not in self.__dict__):
             setattr(self._xml_object, key, value)
         else:
             super().__setattr__(key, value)
@@ -54,9 +48,6 @@ class XMLWrapper:
         if item == 'xml_object':
             return super().__getattribute__(item)
         try:
-            return self._xml_object.__getattribute__(item)
+            return getattr(self._xml_object, item)
         except AttributeError:
-            try:
-                return self._xml_object.__getattr__(item)
-            except AttributeError:
-                return super().__getattribute__(item)
+            return super().__getattribute__(item)
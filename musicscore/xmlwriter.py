@@ -0,0 +1,61 @@
+import xml.etree.ElementTree as ET
+from typing import TextIO
+from xml.sax.saxutils import XMLGenerator
+
+from musicxml.xmlelement.xmlelement import XMLScorePartwise, XMLPart
+
+__all__ = ['XML_HEADER', 'StreamingXMLWriter']
+
+#:
+XML_HEADER = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<!DOCTYPE score-partwise PUBLIC
+    "-//Recordare//DTD MusicXML 4.0 Partwise//EN"
+    "http://www.musicxml.org/dtds/partwise.dtd">
+"""
+
+
+class StreamingXMLWriter:
+    """
+    StreamingXMLWriter writes a finalized :obj:`~musicxml.xmlelement.xmlelement.XMLScorePartwise` incrementally to a file
+    handle.
+
+    Only the container elements ``<score-partwise>`` and ``<part>`` are written as start and end tags. All their other
+    children (for example ``<part-list>`` or ``<measure>``) are converted one after another to an ElementTree element,
+    indented to their depth in the tree and written directly to the output. In this way the whole score is never
+    materialized as one ElementTree or as one string. The final xsd checks are run once on the whole tree before writing.
+    """
+    _STREAMED_CLASSES = (XMLScorePartwise, XMLPart)
+    _INDENT = '  '
+
+    def __init__(self, out: TextIO):
+        self._out = out
+        self._generator = XMLGenerator(out, 'utf-8', short_empty_elements=True)
+
+    def _write_element(self, xml_element: 'XMLElement', level: int) -> None:
+        self._out.write(self._INDENT * level)
+        if not isinstance(xml_element, self._STREAMED_CLASSES) or not xml_element.get_children():
+            et_xml_element = xml_element.et_xml_element
+            ET.indent(et_xml_element, space=self._INDENT, level=level)
+            self._out.write(ET.tostring(et_xml_element, encoding='unicode'))
+            self._out.write('\n')
+            return
+        attributes = {key: str(value) for key, value in xml_element.attributes.items()}
+        self._generator.startElement(xml_element.name, attributes)
+        self._generator.ignorableWhitespace('\n')
+        for child in xml_element.get_children():
+            self._write_element(child, level + 1)
+        self._out.write(self._INDENT * level)
+        self._generator.endElement(xml_element.name)
+        self._out.write('\n')
+
+    def write(self, xml_element: 'XMLElement') -> None:
+        """
+        Writes xml_element and all its descendents to the output.
+
+        :param xml_element: root element (usually an :obj:`~musicxml.xmlelement.xmlelement.XMLScorePartwise`)
+        :return: None
+        :exception: :obj:`~musicxml.exceptions.XMLElementChildrenRequired` and other exceptions of the final xsd checks
+        """
+        if xml_element.xsd_check:
+            xml_element._final_checks()
+        self._write_element(xml_element, 0)